@@ -1,10 +1,13 @@
 import os
+import secrets
+from datetime import timedelta
 from flask import Flask, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
 from flask_migrate import Migrate
 
-from utils.db import db  # SQLAlchemy()
+from utils.db import db, init_read_routing, READ_BIND  # SQLAlchemy()
+from utils.auth import init_auth
 
 def create_app() -> Flask:
     """Trivia-creator backend (clean daily-run version)."""
@@ -20,6 +23,26 @@ def create_app() -> Flask:
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", default_sqlite)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    # optional read replica for read-only endpoints (falls back to the primary when lagging/down)
+    read_url = os.getenv("DATABASE_READ_URL")
+    if read_url:
+        app.config["SQLALCHEMY_BINDS"] = {READ_BIND: read_url}
+    app.config["DATABASE_READ_MAX_LAG_SEC"] = float(os.getenv("DATABASE_READ_MAX_LAG_SEC", "5"))
+    app.config["DATABASE_READ_STICKY_SEC"] = int(os.getenv("DATABASE_READ_STICKY_SEC", "5"))
+
+    # JWT – signed access/refresh tokens, verified without a DB lookup
+    jwt_secret = os.getenv("JWT_SECRET_KEY") or os.getenv("FLASK_SECRET_KEY")
+    if not jwt_secret:
+        if os.getenv("FLASK_DEBUG", "0") != "1":
+            raise RuntimeError("JWT_SECRET_KEY (or FLASK_SECRET_KEY) must be set outside debug mode")
+        # dev only: random per-process key – tokens stop working after a restart
+        jwt_secret = secrets.token_urlsafe(32)
+    elif len(jwt_secret) < 32:
+        app.logger.warning("JWT secret is shorter than 32 bytes; use a long random value")
+    app.config["JWT_SECRET_KEY"] = jwt_secret
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(minutes=int(os.getenv("JWT_ACCESS_MINUTES", "60")))
+    app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(days=int(os.getenv("JWT_REFRESH_DAYS", "30")))
+
     # CORS (5173=Vite, 3000=CRA) – can be overridden via CORS_ORIGINS in .env
     cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:3000")
     origins_list = [o.strip() for o in cors_origins.split(",") if o.strip()]
@@ -27,6 +50,8 @@ def create_app() -> Flask:
 
     # ---------- Init ----------
     db.init_app(app)
+    init_read_routing(app)
+    init_auth(app)
     Migrate(app, db)
 
    # import & register blueprints
@@ -50,14 +75,18 @@ def create_app() -> Flask:
     # ---------- Health ----------
     @app.get("/")
     def root():
-        return jsonify({"ok": True, "db": str(db.engine.url)})
+        data = {"ok": True, "db": str(db.engine.url)}
+        if READ_BIND in db.engines:
+            data["db_read"] = str(db.engines[READ_BIND].url)
+        return jsonify(data)
 
     return app
 
 
 if __name__ == "__main__":
+    os.environ.setdefault("FLASK_DEBUG", "1")  # `python app.py` is the dev server
     app = create_app()
     port = int(os.getenv("PORT", "5001"))
-    debug = os.getenv("FLASK_DEBUG", "1") == "1"
+    debug = os.getenv("FLASK_DEBUG") == "1"
     print(f">>> Flask on http://localhost:{port}")
     app.run(host="0.0.0.0", port=port, debug=debug)
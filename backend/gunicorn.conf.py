@@ -0,0 +1,23 @@
+import os
+
+# Cooperative (gevent) worker: every request – including each idle SSE room
+# stream – runs in a greenlet, not an OS thread. The gevent worker
+# monkey-patches the stdlib (socket, threading, queue, time) before the app is
+# imported, so the locks/queues/timers in utils/rooms.py become greenlet-aware.
+worker_class = "gevent"
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "10000"))
+
+# Live rooms are held in memory by the process that created them, so there is
+# exactly one worker. Deliberately not read from WEB_CONCURRENCY, which hosting
+# platforms set to >1 and would scatter a room's requests across processes.
+workers = 1
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension that gevent cannot patch; make it yield to the
+    # hub while waiting on Postgres instead of blocking the whole worker.
+    # Runs before the app is loaded, so auto-seed queries are covered too.
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
@@ -1,5 +1,5 @@
 from .library import library_bp
-from . import topics, quizzes, questions, sessions, leaderboard, users  
+from . import topics, quizzes, questions, sessions, leaderboard, users, rooms, export
 
 __all__ = ["library_bp"]
 
@@ -0,0 +1,121 @@
+import json
+import zlib
+from flask import request, Response, stream_with_context
+from sqlalchemy import select
+from utils.db import db, read_only
+from models import Quiz, TriviaQuestion
+from .library import library_bp, j_err
+
+EXPORT_BATCH = 1000        # rows fetched per round-trip from the server-side cursor
+EXPORT_CHUNK = 64 * 1024   # bytes buffered before a chunk is sent
+
+
+# ---------- helpers ----------
+def export_rows():
+    # one flat row per question (quizzes without questions appear once with NULLs),
+    # ordered so each quiz's rows are consecutive
+    stmt = (
+        select(
+            Quiz.id, Quiz.title, Quiz.topic, Quiz.difficulty,
+            TriviaQuestion.question, TriviaQuestion.difficulty, TriviaQuestion.answers,
+            TriviaQuestion.topic,
+        )
+        .outerjoin(TriviaQuestion, TriviaQuestion.quiz_id == Quiz.id)
+        .order_by(Quiz.id, TriviaQuestion.id)
+        .execution_options(yield_per=EXPORT_BATCH)
+    )
+    return db.session.execute(stmt)
+
+
+def dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def quiz_head(row):
+    return {"title": row[1], "topic": row[2], "difficulty": row[3]}
+
+
+def question_of(row):
+    return {"question": row[4], "topic": row[7], "difficulty": row[5], "answers": row[6]}
+
+
+def iter_ndjson(rows):
+    # one quiz per line, questions inline – POST the file to /library/import as application/x-ndjson
+    current_id, quiz = None, None
+    for row in rows:
+        if row[0] != current_id:
+            if quiz is not None:
+                yield dump(quiz) + "\n"
+            current_id, quiz = row[0], {**quiz_head(row), "questions": []}
+        if row[4] is not None:
+            quiz["questions"].append(question_of(row))
+    if quiz is not None:
+        yield dump(quiz) + "\n"
+
+
+def iter_seed_json(rows):
+    # same shape as data/seed_quizzes.json, written question by question
+    yield '{"quizzes":['
+    current_id, first_q = None, True
+    for row in rows:
+        if row[0] != current_id:
+            if current_id is not None:
+                yield "]},"
+            current_id, first_q = row[0], True
+            yield dump(quiz_head(row))[:-1] + ',"questions":['
+        if row[4] is not None:
+            yield ("" if first_q else ",") + dump(question_of(row))
+            first_q = False
+    if current_id is not None:
+        yield "]}"
+    yield "]}\n"
+
+
+def chunked(parts, compress=False):
+    gz = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    buf, size = [], 0
+    for part in parts:
+        data = part.encode("utf-8")
+        buf.append(data)
+        size += len(data)
+        if size >= EXPORT_CHUNK:
+            out = b"".join(buf)
+            buf, size = [], 0
+            out = gz.compress(out) if gz else out
+            if out:
+                yield out
+    out = b"".join(buf)
+    if gz:
+        out = gz.compress(out) + gz.flush()
+    if out:
+        yield out
+
+
+# ---------- Export ----------
+@library_bp.get("/export")
+def export_library():
+    fmt = (request.args.get("format") or "ndjson").strip().lower()
+    compress = request.args.get("gzip", "0").strip().lower() in ("1", "true", "yes")
+    if fmt == "ndjson":
+        parts, mimetype, ext = iter_ndjson, "application/x-ndjson", "ndjson"
+    elif fmt == "json":
+        parts, mimetype, ext = iter_seed_json, "application/json", "json"
+    else:
+        return j_err("bad_request", "format must be 'ndjson' or 'json'", 400)
+    filename = f"library.{ext}" + (".gz" if compress else "")
+    if compress:
+        mimetype = "application/gzip"
+
+    def generate():
+        # runs after the view returns, so mark the replica-safe block here
+        with read_only():
+            yield from chunked(parts(export_rows()), compress)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Accel-Buffering": "no",
+        },
+    )
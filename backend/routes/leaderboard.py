@@ -1,10 +1,12 @@
 from flask import request
+from utils.db import read_only
 from models import LeaderboardEntry
 from .library import library_bp, j_ok, j_err
 
 
 # ---------- Leaderboard ----------
 @library_bp.get("/leaderboard")
+@read_only()
 def leaderboard():
     quiz_id = request.args.get("quiz_id", type=int)
     if not quiz_id:
@@ -4,7 +4,7 @@ import random
 
 from utils.db import db
 from utils.helpers import j_ok, j_err, norm, ensure_answers
-from models import TriviaQuestion, Quiz, QuizSession, QuizAnswerLog, LeaderboardEntry
+from models import User, TriviaQuestion, Quiz, QuizSession, QuizAnswerLog, LeaderboardEntry
 
 library_bp = Blueprint("library_bp", __name__)
 
@@ -15,6 +15,12 @@ def get_session_or_error(sid: int):
         return None, j_err("not_found", "session not found", 404)
     return s, None
 
+def guest_name_error(name: str):
+    # guests may not play under a registered username (only its token can)
+    if User.query.filter_by(username=name).first():
+        return j_err("name_taken", "this name belongs to a registered user; log in to use it", 409)
+    return None
+
 def get_quiz_and_questions(quiz_id: int):
     quiz = Quiz.query.get(quiz_id)
     if not quiz:
@@ -1,10 +1,12 @@
 from flask import request
+from flask_jwt_extended import jwt_required
 from utils.db import db
 from models import TriviaQuestion, Quiz
 from .library import library_bp, j_ok, j_err, norm, ensure_answers
 
 
 @library_bp.post("/questions")
+@jwt_required()
 def add_question():
     b = request.get_json(silent=True) or {}
     question = norm(b.get("question"))
@@ -1,11 +1,15 @@
+import json
 from flask import request
-from utils.db import db
+from flask_jwt_extended import jwt_required
+from utils.auth import current_user_id
+from utils.db import db, read_only
 from models import TriviaQuestion, Quiz, LeaderboardEntry
 from .library import library_bp, j_ok, j_err, norm, ensure_answers
 
 
 # ---------- Quizzes ----------
 @library_bp.get("/quizzes")
+@read_only()
 def list_quizzes():
     topic = norm(request.args.get("topic")) or None
     q = Quiz.query
@@ -26,6 +30,7 @@ def list_quizzes():
 
 
 @library_bp.get("/quizzes/<int:quiz_id>")
+@read_only()
 def get_quiz(quiz_id: int):
     quiz = Quiz.query.get(quiz_id)
     if not quiz:
@@ -51,6 +56,7 @@ def get_quiz(quiz_id: int):
 
 
 @library_bp.post("/quizzes")
+@jwt_required()
 def create_quiz():
     b = request.get_json(silent=True) or {}
     title = norm(b.get("title"))
@@ -58,19 +64,30 @@ def create_quiz():
     difficulty = norm(b.get("difficulty")) or None
     if not title or not topic:
         return j_err("bad_request", "title & topic are required", 400)
-    row = Quiz(title=title, topic=topic, difficulty=difficulty)
+    row = Quiz(title=title, topic=topic, difficulty=difficulty, owner_user_id=current_user_id())
     db.session.add(row)
     db.session.commit()
     return j_ok({"id": row.id}, 201)
 
 
 @library_bp.post("/import")
+@jwt_required()
 def bulk_import():
-    body = request.get_json(silent=True) or {}
-    quizzes = body.get("quizzes", [])
+    if request.mimetype == "application/x-ndjson":
+        # one quiz object per line, as written by GET /library/export?format=ndjson
+        try:
+            quizzes = [json.loads(line) for line in request.get_data(as_text=True).splitlines() if line.strip()]
+        except ValueError:
+            return j_err("bad_request", "invalid NDJSON line", 400)
+        if not all(isinstance(qz, dict) for qz in quizzes):
+            return j_err("bad_request", "each NDJSON line must be a quiz object", 400)
+    else:
+        body = request.get_json(silent=True) or {}
+        quizzes = body.get("quizzes", [])
     if not quizzes or not isinstance(quizzes, list):
         return j_err("bad_request", "quizzes must be a non-empty array", 400)
     created = []
+    owner_id = current_user_id()
     try:
         for qz in quizzes:
             title = norm(qz.get("title"))
@@ -79,7 +96,7 @@ def bulk_import():
             questions = qz.get("questions", [])
             if not title or not topic:
                 return j_err("bad_request", "title & topic required for each quiz", 400)
-            quiz = Quiz(title=title, topic=topic, difficulty=difficulty)
+            quiz = Quiz(title=title, topic=topic, difficulty=difficulty, owner_user_id=owner_id)
             db.session.add(quiz)
             db.session.flush()
             for q in questions:
@@ -91,7 +108,7 @@ def bulk_import():
                     return j_err("bad_request", err or "invalid question/answers", 400)
                 tq = TriviaQuestion(
                     question=question_text,
-                    topic=topic,
+                    topic=norm(q.get("topic")) or topic,
                     difficulty=q_diff,
                     answers=answers,
                     quiz_id=quiz.id
@@ -106,6 +123,7 @@ def bulk_import():
 
 
 @library_bp.delete("/quizzes/<int:quiz_id>")
+@jwt_required()
 def delete_quiz(quiz_id):
     quiz = Quiz.query.get(quiz_id)
     if not quiz:
@@ -116,6 +134,7 @@ def delete_quiz(quiz_id):
 
 
 @library_bp.delete("/topics/<string:topic>")
+@jwt_required()
 def delete_topic(topic):
     topic = topic.strip()
     if not topic:
@@ -131,6 +150,7 @@ def delete_topic(topic):
 
 
 @library_bp.delete("/leaderboard")
+@jwt_required()
 def delete_leaderboard():
     deleted = LeaderboardEntry.query.delete(synchronize_session=False)
     db.session.commit()
@@ -0,0 +1,162 @@
+from flask import current_app, request, Response, stream_with_context
+from flask_jwt_extended import jwt_required
+from utils.auth import current_user_id, current_username
+from utils.db import db
+from utils.rooms import hub, DEFAULT_SECONDS, MAX_SECONDS
+from models import LeaderboardEntry
+from .library import library_bp, j_ok, j_err, norm, get_quiz_and_questions, guest_name_error
+
+
+# ---------- helpers ----------
+def get_room_or_error(rid: int):
+    room = hub.get(rid)
+    if not room:
+        return None, j_err("not_found", "room not found", 404)
+    return room, None
+
+
+def get_hosted_room_or_error(rid: int):
+    room, err = get_room_or_error(rid)
+    if err:
+        return None, err
+    if room.host_user_id != current_user_id():
+        return None, j_err("forbidden", "only the room host can do this", 403)
+    return room, None
+
+
+def persist_results(room):
+    # write each player's final score once, when the room finishes
+    with room.lock:
+        if not room.finished or room.persisted:
+            return
+        room.persisted = True
+        rows = [
+            LeaderboardEntry(
+                quiz_id=room.quiz_id,
+                user_id=p["user_id"],
+                player_name=p["name"],
+                score=p["score"],
+                duration_ms=p["duration_ms"],
+            )
+            for p in room.players.values()
+        ]
+    db.session.add_all(rows)
+    db.session.commit()
+
+
+def finish_room(app):
+    # runs when the last question closes – possibly from the deadline timer,
+    # outside any request – so it brings its own app context
+    def on_finish(room):
+        with app.app_context():
+            persist_results(room)
+        hub.close(room.id)
+    return on_finish
+
+
+# ---------- Live rooms ----------
+@library_bp.post("/rooms")
+@jwt_required()
+def room_create():
+    b = request.get_json(silent=True) or {}
+    quiz_id = b.get("quiz_id")
+    try:
+        seconds = DEFAULT_SECONDS if b.get("seconds") is None else int(b["seconds"])
+    except (TypeError, ValueError):
+        return j_err("bad_request", "seconds must be an integer", 400)
+    if not quiz_id:
+        return j_err("bad_request", "quiz_id is required", 400)
+    if not 0 < seconds <= MAX_SECONDS:
+        return j_err("bad_request", f"seconds must be between 1 and {MAX_SECONDS}", 400)
+    quiz, questions, err = get_quiz_and_questions(quiz_id)
+    if err:
+        return err
+    snapshot = [
+        {"id": q.id, "question": q.question, "answers": list(q.answers)}
+        for q in questions
+    ]
+    room = hub.create(
+        quiz.id, quiz.title, snapshot, seconds,
+        host_user_id=current_user_id(),
+        on_finish=finish_room(current_app._get_current_object()),
+    )
+    return j_ok({"room_id": room.id}, 201)
+
+
+@library_bp.get("/rooms/<int:rid>")
+def room_state(rid: int):
+    room, err = get_room_or_error(rid)
+    if err:
+        return err
+    with room.lock:
+        data = room.snapshot()
+    return j_ok(data)
+
+
+@library_bp.get("/rooms/<int:rid>/stream")
+def room_stream(rid: int):
+    room, err = get_room_or_error(rid)
+    if err:
+        return err
+    sub = room.subscribe()
+    return Response(
+        stream_with_context(room.stream(sub)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@library_bp.post("/rooms/<int:rid>/join")
+def room_join(rid: int):
+    b = request.get_json(silent=True) or {}
+    user_id = current_user_id(optional=True)
+    player = (current_username() if user_id else None) or norm(b.get("player_name"))
+    if not player:
+        return j_err("bad_request", "player_name is required", 400)
+    if not user_id:
+        err = guest_name_error(player)
+        if err:
+            return err
+    room, err = get_room_or_error(rid)
+    if err:
+        return err
+    err = room.join(player, user_id)
+    if err:
+        return j_err(*err)
+    return j_ok({"room_id": room.id, "player_name": player}, 201)
+
+
+@library_bp.post("/rooms/<int:rid>/next")
+@jwt_required()
+def room_next(rid: int):
+    room, err = get_hosted_room_or_error(rid)
+    if err:
+        return err
+    return j_ok({"status": room.advance()})
+
+
+@library_bp.post("/rooms/<int:rid>/answer")
+def room_answer(rid: int):
+    b = request.get_json(silent=True) or {}
+    user_id = current_user_id(optional=True)
+    player = (current_username() if user_id else None) or norm(b.get("player_name"))
+    answer = norm(b.get("answer"))
+    if not player:
+        return j_err("bad_request", "player_name is required", 400)
+    room, err = get_room_or_error(rid)
+    if err:
+        return err
+    result, err = room.answer(player, answer, user_id)
+    if err:
+        return j_err(*err)
+    return j_ok(result)
+
+
+@library_bp.delete("/rooms/<int:rid>")
+@jwt_required()
+def room_close(rid: int):
+    room, err = get_hosted_room_or_error(rid)
+    if err:
+        return err
+    hub.close(room.id)
+    return j_ok({"message": f"Room {rid} closed"})
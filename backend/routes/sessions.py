@@ -1,16 +1,23 @@
 import random
 from flask import request
 from sqlalchemy import func
+from utils.auth import current_user_id, current_username
 from utils.db import db
 from models import Quiz, QuizSession, QuizAnswerLog, LeaderboardEntry
-from .library import library_bp, j_ok, j_err, norm, get_session_or_error, get_quiz_and_questions
+from .library import library_bp, j_ok, j_err, norm, get_session_or_error, get_quiz_and_questions, guest_name_error
 
 
 # ---------- Game session ----------
 @library_bp.post("/session/create")
 def session_create():
     b = request.get_json(silent=True) or {}
-    player = norm(b.get("player_name")) or "guest"
+    user_id = current_user_id(optional=True)
+    # signed-in players are named by their token, guests by the request body
+    player = (current_username() if user_id else None) or norm(b.get("player_name")) or "guest"
+    if not user_id:
+        err = guest_name_error(player)
+        if err:
+            return err
     quiz_id = b.get("quiz_id")
     if not quiz_id:
         return j_err("bad_request", "quiz_id is required", 400)
@@ -19,6 +26,7 @@ def session_create():
         return err
     s = QuizSession(
         quiz_id=quiz.id,
+        player_user_id=user_id,
         player_name=player,
         score=0,
         total_questions=len(questions),
@@ -57,9 +65,12 @@ def session_answer(sid: int):
     b = request.get_json(silent=True) or {}
     answer = norm(b.get("answer"))
     client_ms = int(b.get("client_ms") or 0)
+    user_id = current_user_id(optional=True)
     s, err = get_session_or_error(sid)
     if err:
         return err
+    if s.player_user_id and s.player_user_id != user_id:
+        return j_err("forbidden", "session belongs to another player", 403)
     quiz, questions, err = get_quiz_and_questions(s.quiz_id)
     if err:
         return err
@@ -87,7 +98,7 @@ def session_answer(sid: int):
         ).filter(QuizAnswerLog.session_id == s.id).scalar()
         lb = LeaderboardEntry(
             quiz_id=quiz.id,
-            user_id=getattr(s, "player_user_id", None),
+            user_id=s.player_user_id,
             player_name=s.player_name,
             score=s.score,
             duration_ms=int(total_ms or 0),
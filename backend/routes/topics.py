@@ -1,10 +1,11 @@
-from utils.db import db
+from utils.db import db, read_only
 from models import TriviaQuestion
 from .library import library_bp, j_ok
 
 
 # ---------- Topics ----------
 @library_bp.get("/topics")
+@read_only()
 def topics():
     rows = (
         db.session.query(TriviaQuestion.topic)
@@ -1,8 +1,12 @@
 from flask import Blueprint, request, jsonify
 from werkzeug.security import generate_password_hash, check_password_hash
+from flask_jwt_extended import (
+    create_access_token, create_refresh_token, jwt_required, get_jwt, get_jwt_identity,
+)
 
 from utils.db import db
 from utils.helpers import j_ok, j_err, norm
+from utils.auth import revoke
 from models import User
 
 user_bp = Blueprint("user_bp", __name__)
@@ -16,6 +20,9 @@ def signup():
     if not username or not password:
         return j_err("bad_request", "username & password required", 400)
 
+    if username.lower() == "guest":
+        return j_err("bad_request", "'guest' is reserved for anonymous players", 400)
+
     if User.query.filter_by(username=username).first():
         return j_err("duplicate", "username already exists", 409)
 
@@ -39,6 +46,28 @@ def login():
     if not user or not check_password_hash(user.password_hash, password):
         return j_err("unauthorized", "invalid username or password", 401)
 
-    return j_ok({"user_id": user.id, "username": user.username})
+    claims = {"username": user.username}
+    return j_ok({
+        "user_id": user.id,
+        "username": user.username,
+        "access_token": create_access_token(identity=str(user.id), additional_claims=claims, fresh=True),
+        "refresh_token": create_refresh_token(identity=str(user.id), additional_claims=claims),
+    })
+
+
+@user_bp.post("/refresh")
+@jwt_required(refresh=True)
+def refresh():
+    # no DB lookup: identity and username come from the signed refresh token
+    claims = {"username": get_jwt().get("username")}
+    return j_ok({"access_token": create_access_token(identity=get_jwt_identity(), additional_claims=claims)})
+
+
+@user_bp.post("/logout")
+@jwt_required(verify_type=False)
+def logout():
+    # revokes the presented token (send the access and the refresh token to end both)
+    revoke(get_jwt())
+    return j_ok({"message": "token revoked"})
 
 
@@ -0,0 +1,33 @@
+import argparse, requests, sys
+from pathlib import Path
+
+# robust path: backend/tools -> parents[1] == backend/
+ROOT = Path(__file__).resolve().parents[1]
+API = "http://localhost:5001/library/export"
+
+def main():
+    ap = argparse.ArgumentParser(description="Stream the quiz library to a file.")
+    ap.add_argument("--format", choices=["ndjson", "json"], default="ndjson",
+                    help="ndjson: one quiz per line; json: seed_quizzes.json shape")
+    ap.add_argument("--gzip", action="store_true", help="gzip-compress on the server")
+    ap.add_argument("-o", "--out", help="output file (default: data/export.<ext>[.gz])")
+    args = ap.parse_args()
+
+    ext = args.format + (".gz" if args.gzip else "")
+    out = Path(args.out) if args.out else ROOT / "data" / f"export.{ext}"
+    params = {"format": args.format, "gzip": "1" if args.gzip else "0"}
+    # raw stream: a gzip export is saved as-is, not decompressed
+    with requests.get(API, params=params, stream=True, timeout=30) as r:
+        if r.status_code != 200:
+            print("Status:", r.status_code, file=sys.stderr)
+            print(r.text, file=sys.stderr)
+            sys.exit(1)
+        written = 0
+        with out.open("wb") as f:
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+                written += len(chunk)
+    print(f"Wrote {written} bytes to {out}")
+
+if __name__ == "__main__":
+    main()
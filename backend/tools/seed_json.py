@@ -1,17 +1,25 @@
-import json, requests, sys
+import json, os, requests, sys
 from pathlib import Path
 
 # robust path: backend/tools -> parents[1] == backend/
 ROOT = Path(__file__).resolve().parents[1]
 API = "http://localhost:5001/library/import"  # שימי לב ל-/library
+LOGIN = "http://localhost:5001/users/login"
 PATH = ROOT / "data" / "seed_quizzes.json"
 
 def main():
     if not PATH.exists():
         print(f"File not found: {PATH}", file=sys.stderr)
         sys.exit(1)
+    # import requires a signed-in user: SEED_USERNAME / SEED_PASSWORD
+    creds = {"username": os.getenv("SEED_USERNAME", ""), "password": os.getenv("SEED_PASSWORD", "")}
+    login = requests.post(LOGIN, json=creds, timeout=30).json()
+    if not login.get("ok"):
+        print("Login failed:", login.get("error"), file=sys.stderr)
+        sys.exit(1)
+    headers = {"Authorization": f"Bearer {login['data']['access_token']}"}
     payload = json.loads(PATH.read_text(encoding="utf-8"))
-    r = requests.post(API, json=payload, timeout=30)
+    r = requests.post(API, json=payload, headers=headers, timeout=30)
     print("Status:", r.status_code)
     print(r.text)
 
@@ -0,0 +1,67 @@
+import threading
+import time
+
+from flask_jwt_extended import JWTManager, get_jwt, get_jwt_identity, verify_jwt_in_request
+from utils.helpers import j_err
+
+jwt = JWTManager()
+
+# In-memory revocation list: jti -> token expiry (epoch seconds).
+# Entries are dropped once the token would have expired anyway, so the list
+# stays small. It is per-process: with several workers, use short access
+# token lifetimes or move this to a shared store.
+_revoked = {}
+_revoked_lock = threading.Lock()
+
+
+def revoke(claims):
+    now = time.time()
+    with _revoked_lock:
+        for jti, exp in list(_revoked.items()):
+            if exp < now:
+                del _revoked[jti]
+        _revoked[claims["jti"]] = claims.get("exp") or now + 86400
+
+
+def is_revoked(jti):
+    return jti in _revoked
+
+
+def current_user_id(optional=False):
+    """User id from the request's access token (None for guests when optional)."""
+    verify_jwt_in_request(optional=optional)
+    identity = get_jwt_identity()
+    return int(identity) if identity is not None else None
+
+
+def current_username():
+    return get_jwt().get("username")
+
+
+def init_auth(app):
+    jwt.init_app(app)
+
+    @jwt.token_in_blocklist_loader
+    def _check_revoked(jwt_header, jwt_payload):
+        return is_revoked(jwt_payload["jti"])
+
+    # keep the {"ok": false, "error": {...}} envelope for auth failures
+    @jwt.unauthorized_loader
+    def _missing(msg):
+        return j_err("unauthorized", msg, 401)
+
+    @jwt.invalid_token_loader
+    def _invalid(msg):
+        return j_err("invalid_token", msg, 401)
+
+    @jwt.expired_token_loader
+    def _expired(jwt_header, jwt_payload):
+        return j_err("token_expired", "token has expired", 401)
+
+    @jwt.revoked_token_loader
+    def _revoked_token(jwt_header, jwt_payload):
+        return j_err("token_revoked", "token has been revoked", 401)
+
+    @jwt.needs_fresh_token_loader
+    def _not_fresh(jwt_header, jwt_payload):
+        return j_err("fresh_token_required", "fresh token required", 401)
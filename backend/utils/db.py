@@ -1,3 +1,113 @@
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context, request
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import text
+from sqlalchemy.sql.dml import UpdateBase
+
+READ_BIND = "read"
+STICKY_COOKIE = "db_primary_until"
+
+# replica health cache: (checked_at, healthy)
+_replica_state = {"checked_at": 0.0, "healthy": True}
+
+
+def replica_lag_seconds(engine):
+    """Seconds the replica is behind the primary (0 where the dialect has no notion of it)."""
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            # a caught-up replica of an idle primary has an old replay timestamp but no
+            # outstanding WAL – only measure time lag while there is WAL left to replay
+            lag = conn.execute(text(
+                "SELECT CASE "
+                "WHEN NOT pg_is_in_recovery() THEN 0 "
+                "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+                "END"
+            )).scalar()
+            return float(lag or 0)
+        conn.execute(text("SELECT 1"))
+        return 0.0
+
+
+def replica_healthy(engine):
+    # probe at most once per DATABASE_READ_CHECK_SEC; any error counts as unhealthy
+    now = time.monotonic()
+    if now - _replica_state["checked_at"] < current_app.config["DATABASE_READ_CHECK_SEC"]:
+        return _replica_state["healthy"]
+    try:
+        healthy = replica_lag_seconds(engine) <= current_app.config["DATABASE_READ_MAX_LAG_SEC"]
+    except Exception as e:
+        current_app.logger.warning("read replica unavailable, using primary: %s", e)
+        healthy = False
+    _replica_state.update(checked_at=now, healthy=healthy)
+    return healthy
+
+
+class RoutingSession(Session):
+    """Sends reads from ``read_only`` code to the ``read`` bind; everything else to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica(clause):
+            return self._db.engines[READ_BIND]
+        if isinstance(clause, UpdateBase) or self._flushing:
+            mark_write()
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, clause):
+        if not has_app_context() or READ_BIND not in self._db.engines:
+            return False
+        if not g.get("db_read_only") or g.get("db_primary"):
+            return False
+        if self._flushing or isinstance(clause, UpdateBase) or self.new or self.deleted:
+            return False
+        return replica_healthy(self._db.engines[READ_BIND])
+
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+
+def mark_write():
+    # read-your-writes: once this request has written, its reads stay on the primary
+    if has_app_context():
+        g.db_primary = True
+        g.db_wrote = True
+
+
+@contextmanager
+def read_only():
+    """Mark a route (``@read_only()``) or a block of queries (``with read_only():``) as safe for the replica."""
+    prev = g.get("db_read_only", False)
+    g.db_read_only = True
+    try:
+        yield
+    finally:
+        g.db_read_only = prev
+
+
+def init_read_routing(app):
+    app.config.setdefault("DATABASE_READ_MAX_LAG_SEC", 5.0)
+    app.config.setdefault("DATABASE_READ_CHECK_SEC", 2.0)
+    app.config.setdefault("DATABASE_READ_STICKY_SEC", 5)
+
+    @app.before_request
+    def _sticky_primary():
+        # a client that wrote recently keeps reading from the primary until the replica catches up
+        until = request.cookies.get(STICKY_COOKIE, type=float)
+        if until and until > time.time():
+            g.db_primary = True
 
-db = SQLAlchemy()
+    @app.after_request
+    def _set_sticky(response):
+        if g.get("db_wrote") and READ_BIND in db.engines:
+            sticky = app.config["DATABASE_READ_STICKY_SEC"]
+            # the SPA calls the API cross-origin (fetch with credentials: "include");
+            # over HTTPS allow cross-site too, localhost ports are same-site so Lax works
+            response.set_cookie(
+                STICKY_COOKIE, str(time.time() + sticky),
+                max_age=sticky, httponly=True,
+                samesite="None" if request.is_secure else "Lax", secure=request.is_secure,
+            )
+        return response
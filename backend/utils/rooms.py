@@ -0,0 +1,296 @@
+import heapq
+import itertools
+import json
+import queue
+import random
+import threading
+import time
+
+# In-memory hub for live multiplayer rooms.
+# Every broadcast is encoded once into an SSE frame and the same bytes are
+# handed to each subscriber's queue; slow subscribers are dropped instead of
+# blocking the room. Joins and answers don't broadcast on their own: they mark
+# the standings dirty and one throttled "standings" tick (top-N only) goes out
+# at most every STANDINGS_TICK_SEC, so frame count and size don't grow with
+# the number of players. Run under the gevent worker (gunicorn.conf.py) so the
+# queues, locks and timers below are greenlets rather than OS threads.
+
+STANDINGS_TOP = 10
+STANDINGS_TICK_SEC = 0.5
+# a room emits at most ~2 frames/sec plus one per question, so this covers
+# minutes of a client not reading before it is treated as dead
+SUBSCRIBER_BUFFER = 256
+KEEPALIVE_SEC = 15
+DEFAULT_SECONDS = 20
+MAX_SECONDS = 300
+ROOM_IDLE_SEC = 30 * 60  # rooms with no activity for this long are evicted
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def sse_frame(event, data):
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def kick(sub):
+    # drop whatever is buffered and tell the stream to end
+    with sub.mutex:
+        sub.queue.clear()
+    sub.put_nowait(None)
+
+
+def seat_key(name, user_id=None):
+    # signed-in players own their seat by user id; guests by the name they typed
+    return ("user", user_id) if user_id else ("guest", name)
+
+
+def end(sub):
+    # let the stream drain what is queued (e.g. the final standings), then stop
+    try:
+        sub.put_nowait(None)
+    except queue.Full:
+        kick(sub)
+
+
+class Room:
+    def __init__(self, room_id, quiz_id, title, questions, seconds, host_user_id=None, on_finish=None):
+        self.id = room_id
+        self.quiz_id = quiz_id
+        self.title = title
+        self.host_user_id = host_user_id
+        self.on_finish = on_finish  # called once, outside the lock, when the last question closes
+        # snapshot: [{"id", "question", "answers"}] – answers[0] is correct
+        self.questions = questions
+        self.seconds = seconds
+        self.players = {}      # seat_key -> {"name", "score", "duration_ms", "user_id"}
+        self.answered = set()  # seat keys that answered the current question
+        self.index = -1        # -1 = lobby, len(questions) = finished
+        self.deadline_ms = 0
+        self.options = []
+        self.subscribers = set()
+        self.persisted = False
+        self.timer = None
+        self.tick_timer = None  # pending coalesced standings broadcast
+        self.last_active = time.monotonic()
+        self.lock = threading.Lock()
+
+    # ---------- state (call with lock held) ----------
+    @property
+    def finished(self):
+        return self.index >= len(self.questions)
+
+    @property
+    def status(self):
+        return "finished" if self.finished else ("lobby" if self.index < 0 else "playing")
+
+    def standings(self, limit=STANDINGS_TOP):
+        rows = heapq.nsmallest(
+            limit, self.players.values(),
+            key=lambda p: (-p["score"], p["duration_ms"], p["name"]),
+        )
+        return [
+            {"player_name": p["name"], "score": p["score"], "duration_ms": p["duration_ms"]}
+            for p in rows
+        ]
+
+    def question_payload(self):
+        q = self.questions[self.index]
+        return {
+            "question_id": q["id"],
+            "question": q["question"],
+            "options": self.options,
+            "index": self.index,
+            "total": len(self.questions),
+            "seconds": self.seconds,
+            "deadline_ms": self.deadline_ms,
+        }
+
+    def snapshot(self):
+        data = {
+            "room_id": self.id,
+            "quiz_id": self.quiz_id,
+            "title": self.title,
+            "status": self.status,
+            "players": len(self.players),
+            "standings": self.standings(),
+        }
+        if 0 <= self.index < len(self.questions):
+            data["current"] = self.question_payload()
+        return data
+
+    # ---------- fan-out ----------
+    def subscribe(self):
+        sub = queue.Queue(maxsize=SUBSCRIBER_BUFFER)
+        with self.lock:
+            self.last_active = time.monotonic()
+            self.subscribers.add(sub)
+            sub.put_nowait(sse_frame("state", self.snapshot()))
+        return sub
+
+    def unsubscribe(self, sub):
+        with self.lock:
+            self.subscribers.discard(sub)
+
+    def broadcast(self, event, data):
+        frame = sse_frame(event, data)
+        with self.lock:
+            for sub in list(self.subscribers):
+                try:
+                    sub.put_nowait(frame)
+                except queue.Full:
+                    self.subscribers.discard(sub)
+                    kick(sub)
+
+    def mark_dirty(self):
+        # call with lock held: schedule one standings tick unless one is pending
+        if self.tick_timer is None:
+            self.tick_timer = threading.Timer(STANDINGS_TICK_SEC, self.tick)
+            self.tick_timer.daemon = True
+            self.tick_timer.start()
+
+    def tick(self):
+        with self.lock:
+            self.tick_timer = None
+            data = {"index": self.index, "players": len(self.players), "standings": self.standings()}
+        self.broadcast("standings", data)
+
+    def stream(self, sub):
+        try:
+            while True:
+                try:
+                    frame = sub.get(timeout=KEEPALIVE_SEC)
+                except queue.Empty:
+                    yield b": keepalive\n\n"
+                    continue
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            self.unsubscribe(sub)
+
+    # ---------- game ----------
+    def join(self, name, user_id=None):
+        """Take a seat. Returns an error tuple, or None on success."""
+        key = seat_key(name, user_id)
+        with self.lock:
+            if key in self.players:
+                return ("duplicate", "already joined this room", 409)
+            if not user_id and any(p["name"] == name for p in self.players.values()):
+                return ("duplicate", "player_name already taken in this room", 409)
+            self.players[key] = {"name": name, "score": 0, "duration_ms": 0, "user_id": user_id}
+            self.last_active = time.monotonic()
+            self.mark_dirty()
+        return None
+
+    def cancel_timer(self):
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        if self.tick_timer:
+            self.tick_timer.cancel()
+            self.tick_timer = None
+
+    def advance(self, from_index=None):
+        """Move to the next question (or finish). Returns the new status: lobby|playing|finished."""
+        with self.lock:
+            if self.finished or (from_index is not None and from_index != self.index):
+                return self.status  # finished, or someone already moved the room on
+            self.cancel_timer()
+            if self.index >= 0:
+                # players who let the clock run out used the whole time limit
+                for key, p in self.players.items():
+                    if key not in self.answered:
+                        p["duration_ms"] += self.seconds * 1000
+            self.index += 1
+            self.answered = set()
+            self.last_active = time.monotonic()
+            if self.finished:
+                event, data = "finished", {"standings": self.standings()}
+            else:
+                self.options = list(self.questions[self.index]["answers"])
+                random.shuffle(self.options)
+                self.deadline_ms = now_ms() + self.seconds * 1000
+                event, data = "question", {
+                    **self.question_payload(), "players": len(self.players), "standings": self.standings(),
+                }
+                # close the question at its deadline even if some players never answer
+                self.timer = threading.Timer(self.seconds, self.advance, kwargs={"from_index": self.index})
+                self.timer.daemon = True
+                self.timer.start()
+            status = self.status
+        self.broadcast(event, data)
+        if event == "finished" and self.on_finish:
+            self.on_finish(self)
+        return status
+
+    def answer(self, name, answer, user_id=None):
+        """Grade an answer against the current question. Returns (result, error)."""
+        key = seat_key(name, user_id)
+        with self.lock:
+            if key not in self.players:
+                return None, ("not_found", "player has not joined this room", 404)
+            if self.index < 0 or self.finished:
+                return None, ("bad_request", "no question is open", 400)
+            if key in self.answered:
+                return None, ("duplicate", "already answered this question", 409)
+            # time is measured from when the server opened the question, never taken from the client
+            limit_ms = self.seconds * 1000
+            elapsed_ms = now_ms() - (self.deadline_ms - limit_ms)
+            late = elapsed_ms > limit_ms
+            elapsed_ms = min(max(elapsed_ms, 0), limit_ms)
+            q = self.questions[self.index]
+            is_correct = not late and answer.lower() == q["answers"][0].strip().lower()
+            awarded = max(100, 1000 - (elapsed_ms // 2)) if is_correct else 0
+            p = self.players[key]
+            p["score"] += awarded
+            p["duration_ms"] += elapsed_ms
+            self.answered.add(key)
+            self.last_active = time.monotonic()
+            everyone = len(self.answered) >= len(self.players)
+            index = self.index
+            result = {"is_correct": is_correct, "awarded": awarded, "score": p["score"], "late": late}
+            if not everyone:
+                self.mark_dirty()  # the closing question event carries the standings otherwise
+        if everyone:
+            self.advance(from_index=index)
+        return result, None
+
+
+class RoomHub:
+    def __init__(self):
+        self.rooms = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, quiz_id, title, questions, seconds=DEFAULT_SECONDS, host_user_id=None, on_finish=None):
+        self.sweep()
+        with self._lock:
+            room = Room(next(self._ids), quiz_id, title, questions, seconds, host_user_id, on_finish)
+            self.rooms[room.id] = room
+        return room
+
+    def sweep(self):
+        # evict rooms nobody has touched for ROOM_IDLE_SEC (abandoned lobbies, stalled games)
+        cutoff = time.monotonic() - ROOM_IDLE_SEC
+        for room_id in [rid for rid, r in list(self.rooms.items()) if r.last_active < cutoff]:
+            self.close(room_id)
+
+    def get(self, room_id):
+        return self.rooms.get(room_id)
+
+    def close(self, room_id):
+        with self._lock:
+            room = self.rooms.pop(room_id, None)
+        if room:
+            with room.lock:
+                room.cancel_timer()
+                for sub in room.subscribers:
+                    end(sub)
+                room.subscribers.clear()
+        return room
+
+
+hub = RoomHub()
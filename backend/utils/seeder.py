@@ -34,7 +34,7 @@ def auto_seed():
                                 and all((a or "").strip() for a in answers) and question_text
                             ):
                                 db.session.add(TriviaQuestion(
-                                    question=question_text, topic=topic,
+                                    question=question_text, topic=(q.get("topic") or "").strip() or topic,
                                     difficulty=q_diff, answers=answers, quiz_id=quiz.id
                                 ))
                         created += 1
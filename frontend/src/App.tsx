@@ -6,6 +6,7 @@ import { CssBaseline, ThemeProvider, createTheme, Box } from "@mui/material";
 import Navbar from "@/components/Navbar";
 import RequireAuth from "@/auth/RequireAuth";
 import AuthPage from "@/pages/AuthPageInline";
+import { useApi } from "@/hooks/useApi";
 
 // Pages
 import PlayPicker from "@/pages/play/PlayPicker";
@@ -26,6 +27,7 @@ function getInitialBaseUrl(): string {
 export default function App() {
   const [baseUrl, setBaseUrl] = useState<string>(getInitialBaseUrl());
   const nav = useNavigate();
+  const api = useApi(baseUrl);
 
   useEffect(() => {
     // שמירה אוטומטית של הערך לטובת רענון/פתיחה מחדש
@@ -34,8 +36,8 @@ export default function App() {
     } catch {}
   }, [baseUrl]);
 
-  function logout() {
-    localStorage.removeItem("auth");
+  async function logout() {
+    await api.logout();
     nav("/login");
   }
 
@@ -1,8 +1,9 @@
 import React, { type ReactNode } from "react";
 import { Navigate } from "react-router-dom";
+import { getAuth } from "@/hooks/useApi";
 
 export default function RequireAuth({ children }: { children: ReactNode }) {
-  const hasUser = !!JSON.parse(localStorage.getItem("auth") || "null")?.username;
+  const hasUser = !!getAuth()?.username;
   if (!hasUser) return <Navigate to="/login" replace />;
   return <>{children}</>;
 }
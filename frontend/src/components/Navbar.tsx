@@ -2,6 +2,7 @@
 import React, { useEffect } from "react";
 import { AppBar, Toolbar, IconButton, Typography, Button, TextField, Box, Tooltip } from "@mui/material";
 import { Link as RouterLink, useNavigate } from "react-router-dom";
+import { getAuth } from "@/hooks/useApi";
 import MenuIcon from "@mui/icons-material/Menu";
 import LogoutIcon from "@mui/icons-material/Logout";
 import ArrowBackIcon from "@mui/icons-material/ArrowBack";
@@ -15,7 +16,7 @@ export default function Navbar({
   baseUrl: string;
   setBaseUrl: (v: string) => void;
 }) {
-  const auth = JSON.parse(localStorage.getItem("auth") || "null");
+  const auth = getAuth();
   const nav = useNavigate();
 
   useEffect(() => {
@@ -13,31 +13,93 @@ function getDefaultBase(): string {
   return "/api"; // פיתוח דרך פרוקסי של Vite
 }
 
+// stored login; entries saved before token auth (no access_token) count as logged out
+export function getAuth(): any {
+  try {
+    const auth = JSON.parse(localStorage.getItem("auth") || "null");
+    return auth?.access_token ? auth : null;
+  } catch {
+    return null;
+  }
+}
+
+// refresh-token failures that mean the login is over, not a transient error
+const DEAD_LOGIN_CODES = ["token_expired", "token_revoked", "invalid_token"];
+
+function authHeaders(): Record<string, string> {
+  const token = getAuth()?.access_token;
+  return token ? { Authorization: `Bearer ${token}` } : {};
+}
+
 export function useApi(baseUrl?: string) {
   const base = (baseUrl && baseUrl.trim()) || getDefaultBase();
 
-  async function get<T>(p: string): Promise<J<T>> {
-    try {
-      const r = await fetch(`${base}${p}`);
-      return r.json();
-    } catch (e: any) {
-      return { ok: false, error: { code: "network_error", message: e?.message || "Network error" } };
+  // swap an expired access token for a new one using the stored refresh token
+  async function refresh(): Promise<boolean> {
+    const auth = getAuth();
+    if (!auth?.refresh_token) return false;
+    const r = await fetch(`${base}/users/refresh`, {
+      method: "POST",
+      credentials: "include",
+      headers: { Authorization: `Bearer ${auth.refresh_token}` },
+    });
+    const res = await r.json();
+    if (!res.ok) {
+      if (DEAD_LOGIN_CODES.includes(res.error?.code)) {
+        localStorage.removeItem("auth");
+        window.location.assign("/login");
+      }
+      return false;
     }
+    localStorage.setItem("auth", JSON.stringify({ ...auth, access_token: res.data.access_token }));
+    return true;
   }
 
-  async function post<T>(p: string, body: any): Promise<J<T>> {
+  async function send<T>(p: string, init: RequestInit = {}): Promise<J<T>> {
     try {
-      const r = await fetch(`${base}${p}`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify(body),
+      // credentials: the API is usually another origin; this lets the db_primary_until
+      // (read-your-writes) cookie be stored and sent back
+      const go = () => fetch(`${base}${p}`, {
+        ...init,
+        credentials: "include",
+        headers: { ...(init.headers as any), ...authHeaders() },
       });
-      return r.json();
+      let res: J<T> = await (await go()).json();
+      if (!res.ok && res.error.code === "token_expired" && (await refresh())) {
+        res = await (await go()).json();
+      }
+      return res;
     } catch (e: any) {
       return { ok: false, error: { code: "network_error", message: e?.message || "Network error" } };
     }
   }
 
-  return { get, post, base };
+  async function get<T>(p: string): Promise<J<T>> {
+    return send<T>(p);
+  }
+
+  async function post<T>(p: string, body: any): Promise<J<T>> {
+    return send<T>(p, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+    });
+  }
+
+  // revoke both tokens server-side (best effort), then forget them locally
+  async function logout(): Promise<void> {
+    const auth = getAuth();
+    const tokens = [auth?.access_token, auth?.refresh_token].filter(Boolean);
+    await Promise.all(tokens.map((t) =>
+      fetch(`${base}/users/logout`, {
+        method: "POST",
+        credentials: "include",
+        headers: { Authorization: `Bearer ${t}` },
+      }).catch(() => {}),
+    ));
+    localStorage.removeItem("auth");
+  }
+
+  return { get, post, logout, base };
 }
 
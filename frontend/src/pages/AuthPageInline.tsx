@@ -14,9 +14,11 @@ export default function AuthPage({ baseUrl }: { baseUrl: string }) {
 
   async function doLogin() {
     setErr(null); setMsg(null);
-    const res = await api.post<{ user_id: number; username: string }>("/users/login", { username, password });
+    const res = await api.post<{ user_id: number; username: string; access_token: string; refresh_token: string }>(
+      "/users/login", { username, password },
+    );
     if (!res.ok) { setErr(res.error.message); return; }
-    localStorage.setItem("auth", JSON.stringify(res.data)); // {user_id, username}
+    localStorage.setItem("auth", JSON.stringify(res.data)); // {user_id, username, access_token, refresh_token}
     nav("/play");
   }
 
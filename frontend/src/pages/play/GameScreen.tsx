@@ -2,7 +2,7 @@ import React, { useEffect, useRef, useState } from "react";
 import { Container, Paper, Stack, Chip, Alert, Typography, Box, Button } from "@mui/material";
 import { useLocation, useNavigate, useParams } from "react-router-dom";
 import Crumbs from "../../components/Crumbs";
-import { useApi } from "../../hooks/useApi";
+import { useApi, getAuth } from "../../hooks/useApi";
 import { TIME_LIMIT_SEC, msToSec } from "../../utils/time";
 
 
@@ -27,7 +27,7 @@ export default function GameScreen({ baseUrl }: { baseUrl: string }) {
   const deadlineRef = useRef<number | null>(null);
   const tickerRef = useRef<number | null>(null);
 
-  const playerName = JSON.parse(localStorage.getItem("auth") || "null")?.username || "guest";
+  const playerName = getAuth()?.username || "guest";
 
   function beginQuestion(q: any) {
     setCurrent(q);
@@ -2,7 +2,7 @@ import React, { useEffect, useState } from "react";
 import { Container, Paper, FormControl, InputLabel, Select, MenuItem, Button, Alert, Typography } from "@mui/material";
 import { useNavigate } from "react-router-dom";
 import Crumbs from "../../components/Crumbs";
-import { useApi } from "../../hooks/useApi";
+import { useApi, getAuth } from "../../hooks/useApi";
 
 export default function PlayPicker({ baseUrl }: { baseUrl: string }) {
   const api = useApi(baseUrl);
@@ -12,7 +12,7 @@ export default function PlayPicker({ baseUrl }: { baseUrl: string }) {
   const [quizId, setQuizId] = useState<number | null>(null);
   const [err, setErr] = useState<string | null>(null);
   const nav = useNavigate();
-  const playerName = JSON.parse(localStorage.getItem("auth") || "null")?.username || "guest";
+  const playerName = getAuth()?.username || "guest";
 
   useEffect(() => {
     (async () => {